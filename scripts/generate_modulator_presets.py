@@ -3,106 +3,85 @@
 Generate SideFX Modulator preset file (.rpl).
 """
 
-import base64
+import functools
 import math
 
+try:
+    import pybase64 as _b64mod
+except ImportError:
+    import base64 as _b64mod
 
-def create_basic_preset(name, num_points, points):
-    """For basic shapes WITHOUT curves."""
-    values = ["-"] * 86
-
-    values[0] = "0"
-    values[1] = "1"
-    values[2] = "5"
-    values[3] = "0"
-    values[4] = "0"
-    values[5] = "1"
-
-    values[19] = "0"
-    values[20] = "0"
-    values[21] = "0"
-    values[22] = "0.5"
-    values[23] = "100"
-    values[24] = "500"
-
-    values[25] = "2"
-    values[26] = "1"
-    values[27] = "0"
-    values[28] = "0"
-    values[29] = str(num_points)
+_b64 = _b64mod.b64encode
 
-    for i in range(16):
-        if i < len(points):
-            values[39 + i*2] = str(points[i][0])
-            values[39 + i*2 + 1] = str(points[i][1])
-        else:
-            values[39 + i*2] = "0.5"
-            values[39 + i*2 + 1] = "0.5"
+# Fixed slider values shared by every preset; slot 64 holds the preset name
+_TEMPLATE = ["-"] * 87
+_TEMPLATE[0:6] = ["0", "1", "5", "0", "0", "1"]
+_TEMPLATE[19:25] = ["0", "0", "0", "0.5", "100", "500"]
+_TEMPLATE[25:29] = ["2", "1", "0", "0"]
+_TEMPLATE[64] = None
 
-    values.insert(64, f'"{name}"')
+# Neutral curve values for basic shapes
+_CURVE_ZEROS = ["0"] * 15
 
-    # Explicitly set all curve positions to 0 (neutral)
-    for i in range(15):
-        values[72 + i] = "0"
+_TWO_PI = 2 * math.pi
 
-    full = " ".join(values)
-    encoded = base64.b64encode(full.encode()).decode()
-    lines = [encoded[i:i+80] for i in range(0, len(encoded), 80)]
-    return "\n    ".join(lines)
-
-
-def create_curved_preset(name, num_points, points, curves):
-    """For shapes WITH curves."""
-    values = ["-"] * 86
-
-    values[0] = "0"
-    values[1] = "1"
-    values[2] = "5"
-    values[3] = "0"
-    values[4] = "0"
-    values[5] = "1"
-
-    values[19] = "0"
-    values[20] = "0"
-    values[21] = "0"
-    values[22] = "0.5"
-    values[23] = "100"
-    values[24] = "500"
-
-    values[25] = "2"
-    values[26] = "1"
-    values[27] = "0"
-    values[28] = "0"
-    values[29] = str(num_points)
+# Unused point slots (16 points, X/Y interleaved) sit at the centre
+_POINT_PAD = ["0.5"] * 32
+
+# Point coordinates fill 39-71 around the name slot: the first 25 go
+# before it, the remaining 7 after it
+_NAME_IDX = 64
+_POINTS_BEFORE_NAME = _NAME_IDX - 39
 
-    for i in range(16):
-        if i < len(points):
-            values[39 + i*2] = str(points[i][0])
-            values[39 + i*2 + 1] = str(points[i][1])
-        else:
-            values[39 + i*2] = "0.5"
-            values[39 + i*2 + 1] = "0.5"
+# Encoded preset lines are 80 columns, indented under <PRESET
+_LINE_WIDTH = 80
+_LINE_SEP = b"\n    "
+
+
+@functools.lru_cache(maxsize=128)
+def _build_preset(name, num_points, points, curves=None):
+    """Encode one preset. Shapes without curves get neutral (0) curves.
+
+    Arguments must be hashable: pass points and curves as tuples.
+    """
+    values = _TEMPLATE.copy()
+    values[29] = str(num_points)
 
-    values.insert(64, f'"{name}"')
+    coords = [str(c) for point in points[:16] for c in point]
+    coords += _POINT_PAD[len(coords):]
+    values[39:_NAME_IDX] = coords[:_POINTS_BEFORE_NAME]
+    values[_NAME_IDX] = f'"{name}"'
+    values[_NAME_IDX + 1:72] = coords[_POINTS_BEFORE_NAME:]
 
-    # Curves at positions 73-87 (indices 72-86 after insert)
-    for i, curve in enumerate(curves):
-        if i < 15:
-            values[72 + i] = str(curve)
+    # Curves at positions 73-87 (indices 72-86)
+    if curves is None:
+        values[72:72 + 15] = _CURVE_ZEROS
+    else:
+        curve_values = [str(curve) for curve in curves[:15]]
+        values[72:72 + len(curve_values)] = curve_values
 
     full = " ".join(values)
-    encoded = base64.b64encode(full.encode()).decode()
-    lines = [encoded[i:i+80] for i in range(0, len(encoded), 80)]
-    return "\n    ".join(lines)
+    encoded = _b64(full.encode("ascii"))
+
+    # Wrap at 80 columns into one preallocated buffer
+    view = memoryview(encoded)
+    n = len(view)
+    out = bytearray(n + len(_LINE_SEP) * ((n - 1) // _LINE_WIDTH))
+    pos = 0
+    for i in range(0, n, _LINE_WIDTH):
+        if i:
+            out[pos:pos + len(_LINE_SEP)] = _LINE_SEP
+            pos += len(_LINE_SEP)
+        chunk = view[i:i + _LINE_WIDTH]
+        out[pos:pos + len(chunk)] = chunk
+        pos += len(chunk)
+    return out.decode("ascii")
 
 
 def generate_sine_points(num_points):
-    points = []
-    for i in range(num_points):
-        x = round(i / (num_points - 1), 3)
-        y = round(0.5 + 0.5 * math.sin(2 * math.pi * x), 3)
-        points.append((x, y))
-    return points
+    last = num_points - 1
+    xs = [round(i / last, 3) for i in range(num_points)]
+    return [(x, round(0.5 + 0.5 * math.sin(_TWO_PI * x), 3)) for x in xs]
 
 
 def main():
@@ -119,7 +98,7 @@ def main():
     ]
 
     for name, num_pts, points in basic:
-        encoded = create_basic_preset(name, num_pts, points)
+        encoded = _build_preset(name, num_pts, tuple(map(tuple, points)))
         print(f"  <PRESET `{name}`")
         print(f"    {encoded}")
         print("  >")
@@ -136,7 +115,7 @@ def main():
     ]
 
     for name, num_pts, points, curves in curved:
-        encoded = create_curved_preset(name, num_pts, points, curves)
+        encoded = _build_preset(name, num_pts, tuple(map(tuple, points)), tuple(curves))
         print(f"  <PRESET `{name}`")
         print(f"    {encoded}")
         print("  >")